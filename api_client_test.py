@@ -110,6 +110,27 @@ def test_find_affordable_option():
     
     logging.info("\n✅ Option selection test completed.")
 
+def test_find_option_by_delta():
+    """Test selecting an affordable option closest to a target delta."""
+    access_token = get_jwt_token()
+    if not access_token:
+        logging.error("❌ Authentication failed. Cannot proceed with delta-based option selection test.")
+        return
+
+    expiry = "27-Mar-2025"
+    capital = 3000
+    target_delta = 0.4
+
+    for direction in ("LONG", "SHORT"):
+        option = api_client.find_affordable_option(expiry, capital, direction, target_delta=target_delta)
+        if option and "delta" in option and "iv" in option:
+            logging.info(f"✅ {direction} Option Selected by delta: {option}")
+        else:
+            logging.warning(f"⚠️ No affordable {direction} option with greeks found. Response: {option}")
+        time.sleep(1)  # Small delay to avoid rate limit
+
+    logging.info("\n✅ Delta-based option selection test completed.")
+
 def test_place_order():
     """Test placing a dummy order in paper trading mode."""
     logging.info("🔍 Running Dummy Order Placement Test...")
@@ -187,6 +208,8 @@ if __name__ == "__main__":
         time.sleep(1)
         test_find_affordable_option()
         time.sleep(1)
+        test_find_option_by_delta()
+        time.sleep(1)
         test_place_order()
         time.sleep(1)
         test_save_and_load_paper_positions()
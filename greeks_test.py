@@ -0,0 +1,139 @@
+import logging
+import time
+import sys
+import os
+import numpy as np
+
+# Get the parent directory of the module
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import greeks  # Ensure greeks.py is available
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+# Set the logging level
+logger.setLevel(logging.DEBUG)
+
+# Textbook reference point: S=100, K=100, T=1y, r=5%, sigma=20%
+SPOT = 100.0
+STRIKE = 100.0
+TIME_TO_EXPIRY = 1.0
+RATE = 0.05
+VOLATILITY = 0.2
+
+def test_black_scholes_price():
+    """Test Black-Scholes prices against reference values."""
+    try:
+        call = greeks.black_scholes_price(SPOT, np.array([STRIKE]), TIME_TO_EXPIRY, RATE, VOLATILITY, "CE")
+        put = greeks.black_scholes_price(SPOT, np.array([STRIKE]), TIME_TO_EXPIRY, RATE, VOLATILITY, "PE")
+
+        logger.debug(f"Calculated CE price: {call.tolist()}")
+        logger.debug(f"Calculated PE price: {put.tolist()}")
+
+        assert np.allclose(call, [10.450584], atol=1e-4), "❌ CE price is incorrect."
+        assert np.allclose(put, [5.573526], atol=1e-4), "❌ PE price is incorrect."
+
+        # Put-call parity: C - P = S - K * exp(-rT)
+        parity = SPOT - STRIKE * np.exp(-RATE * TIME_TO_EXPIRY)
+        assert np.allclose(call - put, parity, atol=1e-8), "❌ Put-call parity does not hold."
+        logging.info("✅ Black-Scholes price test passed.")
+    except Exception as e:
+        logging.error(f"❌ Black-Scholes price test failed: {e}")
+
+def test_implied_volatility_round_trip():
+    """Test IV solved across a whole chain recovers the volatility used to price it."""
+    try:
+        strikes = np.arange(21000, 24050, 50, dtype=float)
+        spot = 22500.0
+        time_to_expiry = 7 / 365
+        true_iv = 0.12 + 0.00002 * np.abs(strikes - spot)  # Simple smile
+
+        for option_type in ("CE", "PE"):
+            prices = greeks.black_scholes_price(spot, strikes, time_to_expiry, RATE, true_iv, option_type)
+            iv = greeks.implied_volatility(prices, spot, strikes, time_to_expiry, RATE, option_type)
+
+            # Strikes far from the money carry almost no time value and no IV information
+            forward_strikes = strikes * np.exp(-RATE * time_to_expiry)
+            intrinsic = np.maximum(spot - forward_strikes, 0) if option_type == "CE" else np.maximum(forward_strikes - spot, 0)
+            solvable = prices - intrinsic > 0.5
+            assert iv.shape == strikes.shape, f"❌ {option_type} IV shape does not match the chain."
+            assert np.allclose(iv[solvable], true_iv[solvable], atol=1e-4), f"❌ {option_type} IV round trip failed."
+        logging.info("✅ Implied volatility round trip test passed.")
+    except Exception as e:
+        logging.error(f"❌ Implied volatility round trip test failed: {e}")
+
+def test_implied_volatility_invalid_prices():
+    """Test prices below intrinsic value or non-positive prices give NaN, not an exception."""
+    try:
+        strikes = np.array([22000.0, 22500.0, 23000.0])
+        prices = np.array([100.0, 0.0, 50.0])  # 22000 CE is below its intrinsic value of ~500
+
+        iv = greeks.implied_volatility(prices, 22500.0, strikes, 7 / 365, RATE, "CE")
+
+        assert np.isnan(iv[0]), "❌ Price below intrinsic should give NaN IV."
+        assert np.isnan(iv[1]), "❌ Zero price should give NaN IV."
+        assert np.isfinite(iv[2]) and iv[2] > 0, "❌ Valid price should give a positive IV."
+        logging.info("✅ Invalid price IV test passed.")
+    except Exception as e:
+        logging.error(f"❌ Invalid price IV test failed: {e}")
+
+def test_chain_greeks():
+    """Test delta, gamma, theta (per day) and vega (per 1% vol) against reference values."""
+    try:
+        call_price = greeks.black_scholes_price(SPOT, np.array([STRIKE]), TIME_TO_EXPIRY, RATE, VOLATILITY, "CE")
+        result = greeks.chain_greeks(SPOT, np.array([STRIKE]), call_price, TIME_TO_EXPIRY, RATE, "CE")
+
+        logger.debug(f"Calculated greeks: { {k: v.tolist() for k, v in result.items()} }")
+
+        assert np.allclose(result["iv"], [0.2], atol=1e-6), "❌ IV is incorrect."
+        assert np.allclose(result["delta"], [0.636831], atol=1e-5), "❌ Delta is incorrect."
+        assert np.allclose(result["gamma"], [0.018762], atol=1e-5), "❌ Gamma is incorrect."
+        assert np.allclose(result["theta"], [-0.017573], atol=1e-5), "❌ Theta is incorrect."
+        assert np.allclose(result["vega"], [0.375240], atol=1e-5), "❌ Vega is incorrect."
+
+        put_price = greeks.black_scholes_price(SPOT, np.array([STRIKE]), TIME_TO_EXPIRY, RATE, VOLATILITY, "PE")
+        put_result = greeks.chain_greeks(SPOT, np.array([STRIKE]), put_price, TIME_TO_EXPIRY, RATE, "PE")
+        assert np.allclose(put_result["delta"], result["delta"] - 1, atol=1e-6), "❌ PE delta is incorrect."
+        assert np.allclose(put_result["gamma"], result["gamma"], atol=1e-8), "❌ PE gamma should match CE gamma."
+        logging.info("✅ Chain greeks test passed.")
+    except Exception as e:
+        logging.error(f"❌ Chain greeks test failed: {e}")
+
+def test_chain_greeks_speed():
+    """Test a full NIFTY chain snapshot is processed well under a millisecond per cycle."""
+    try:
+        strikes = np.arange(20000, 25050, 50, dtype=float)
+        spot = 22500.0
+        time_to_expiry = 7 / 365
+        prices = greeks.black_scholes_price(spot, strikes, time_to_expiry, RATE, 0.13, "CE")
+
+        greeks.chain_greeks(spot, strikes, prices, time_to_expiry, RATE, "CE")  # Warm up
+
+        runs = 100
+        start = time.perf_counter()
+        for _ in range(runs):
+            greeks.chain_greeks(spot, strikes, prices, time_to_expiry, RATE, "CE")
+        elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+
+        logging.info(f"🔹 Processed {len(strikes)} strikes in {elapsed_ms:.3f} ms")
+        assert elapsed_ms < 1.0, "❌ Chain greeks calculation is too slow."
+        logging.info("✅ Chain greeks speed test passed.")
+    except Exception as e:
+        logging.error(f"❌ Chain greeks speed test failed: {e}")
+
+if __name__ == "__main__":
+    logging.info("🔍 Running Greeks Tests...\n")
+    time.sleep(1)
+    test_black_scholes_price()
+    time.sleep(1)
+    test_implied_volatility_round_trip()
+    time.sleep(1)
+    test_implied_volatility_invalid_prices()
+    time.sleep(1)
+    test_chain_greeks()
+    time.sleep(1)
+    test_chain_greeks_speed()
+    logging.info("\n✅ All tests completed.")
@@ -2,6 +2,7 @@ import logging
 import time
 import sys
 import os
+import tempfile
 
 # Get the parent directory of the module
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -26,8 +27,116 @@ def test_state_saving_loading():
     except Exception as e:
         logging.error(f"❌ State saving and loading test failed: {e}")
 
+def make_runtime_state():
+    """Build a TradeState with every part of the runtime populated."""
+    state = TradeState()
+    state.open_positions = [{"symbol": "NIFTY27MAR2522600CE", "entry_price": 120, "quantity": 75, "direction": "LONG"}]
+    state.pending_orders = [{"order_id": "250324000123", "symbol": "NIFTY27MAR2522600CE", "is_exit": True}]
+    state.cooldown_until = time.time() + 300
+    state.last_candle_timestamp = "2025-03-24T10:30:00+05:30"
+    state.indicator_state = {"atr": 42.5, "upper": 22610.0, "lower": 22480.0, "trend": True}
+    state.access_token = "mock_access_token"
+    return state
+
+def test_checkpoint_round_trip():
+    """Test the full runtime survives a checkpoint and resume."""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            path = os.path.join(checkpoint_dir, "runtime.ckpt")
+            state = make_runtime_state()
+            state.save_checkpoint(path)
+
+            resumed = TradeState()
+            assert resumed.load_checkpoint(path), "❌ Checkpoint could not be loaded."
+
+            assert resumed.open_positions == state.open_positions, "❌ Open positions were not restored."
+            assert resumed.pending_orders == state.pending_orders, "❌ Pending orders were not restored."
+            assert resumed.cooldown_until == state.cooldown_until, "❌ Cooldown timer was not restored."
+            assert resumed.last_candle_timestamp == state.last_candle_timestamp, "❌ Last candle was not restored."
+            assert resumed.indicator_state == state.indicator_state, "❌ Indicator state was not restored."
+            assert resumed.access_token == state.access_token, "❌ Cached token was not restored."
+        logging.info("✅ Checkpoint round trip test passed.")
+    except Exception as e:
+        logging.error(f"❌ Checkpoint round trip test failed: {e}")
+
+def test_checkpoint_crash_safety():
+    """Test a torn or missing checkpoint is rejected without touching the state."""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            path = os.path.join(checkpoint_dir, "runtime.ckpt")
+            state = make_runtime_state()
+            state.save_checkpoint(path)
+
+            # Simulate the process dying half-way through writing the checkpoint
+            with open(path, "rb") as f:
+                good = f.read()
+            with open(path, "wb") as f:
+                f.write(good[: len(good) // 2])
+
+            resumed = TradeState()
+            assert not resumed.load_checkpoint(path), "❌ Truncated checkpoint should be rejected."
+            assert resumed.open_positions == [], "❌ Rejected checkpoint must leave the state untouched."
+
+            assert not TradeState().load_checkpoint(os.path.join(checkpoint_dir, "missing.ckpt")), \
+                "❌ Missing checkpoint should be reported, not raised."
+        logging.info("✅ Checkpoint crash safety test passed.")
+    except Exception as e:
+        logging.error(f"❌ Checkpoint crash safety test failed: {e}")
+
+def test_candles_to_replay():
+    """Test only candles missed while the process was down are replayed."""
+    try:
+        state = TradeState()
+        state.last_candle_timestamp = "2025-03-24T10:30:00+05:30"
+        candles = [
+            ["2025-03-24T10:27:00+05:30", 22500, 22520, 22490, 22510, 1000],
+            ["2025-03-24T10:30:00+05:30", 22510, 22530, 22500, 22525, 1200],
+            ["2025-03-24T10:33:00+05:30", 22525, 22540, 22515, 22535, 900],
+            ["2025-03-24T10:36:00+05:30", 22535, 22550, 22520, 22530, 1100],
+        ]
+
+        missed = state.candles_to_replay(candles)
+        assert missed == candles[2:], "❌ Wrong candles selected for replay."
+
+        # With no checkpointed candle everything must be replayed
+        assert TradeState().candles_to_replay(candles) == candles, "❌ Fresh state should replay all candles."
+        logging.info("✅ Candle replay test passed.")
+    except Exception as e:
+        logging.error(f"❌ Candle replay test failed: {e}")
+
+def test_checkpoint_resume_speed():
+    """Test checkpointing stays cheap and resume finishes well under a second."""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            path = os.path.join(checkpoint_dir, "runtime.ckpt")
+            state = make_runtime_state()
+            state.indicator_state["history"] = [[i, 22500 + i, 22510 + i, 22490 + i, 22505 + i, 1000] for i in range(5000)]
+
+            start = time.perf_counter()
+            state.save_checkpoint(path)
+            save_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            TradeState().load_checkpoint(path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            logging.info(f"🔹 Checkpoint saved in {save_ms:.2f} ms, resumed in {load_ms:.2f} ms")
+            assert save_ms < 50, "❌ Checkpoint save is too slow for the trading loop."
+            assert load_ms < 1000, "❌ Resume took longer than a second."
+        logging.info("✅ Checkpoint resume speed test passed.")
+    except Exception as e:
+        logging.error(f"❌ Checkpoint resume speed test failed: {e}")
+
 if __name__ == "__main__":
     logging.info("🔍 Running State Manager Tests...\n")
     time.sleep(1)
     test_state_saving_loading()
+    time.sleep(1)
+    test_checkpoint_round_trip()
+    time.sleep(1)
+    test_checkpoint_crash_safety()
+    time.sleep(1)
+    test_candles_to_replay()
+    time.sleep(1)
+    test_checkpoint_resume_speed()
     logging.info("\n✅ All tests completed.")
@@ -0,0 +1,168 @@
+import logging
+import time
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Get the parent directory of the module
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from trade_history import TradeHistory  # Ensure trade_history.py is available
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+
+SAMPLE_FILLS = [
+    {"timestamp": "2025-03-24T09:20:00", "strategy": "supertrend", "symbol": "NIFTY27MAR2522600CE",
+     "expiry": "27-Mar-2025", "side": "BUY", "price": 100, "quantity": 75},
+    {"timestamp": "2025-03-24T10:05:00", "strategy": "supertrend", "symbol": "NIFTY27MAR2522600CE",
+     "expiry": "27-Mar-2025", "side": "SELL", "price": 120, "quantity": 75},
+    {"timestamp": "2025-03-24T11:10:00", "strategy": "trend_flip", "symbol": "NIFTY27MAR2522500PE",
+     "expiry": "27-Mar-2025", "side": "BUY", "price": 80, "quantity": 75},
+    {"timestamp": "2025-03-24T11:40:00", "strategy": "trend_flip", "symbol": "NIFTY27MAR2522500PE",
+     "expiry": "27-Mar-2025", "side": "SELL", "price": 70, "quantity": 75},
+    {"timestamp": "2025-03-25T09:30:00", "strategy": "supertrend", "symbol": "NIFTY03APR2522700CE",
+     "expiry": "03-Apr-2025", "side": "BUY", "price": 150, "quantity": 75},
+    {"timestamp": "2025-03-25T13:15:00", "strategy": "supertrend", "symbol": "NIFTY03APR2522700CE",
+     "expiry": "03-Apr-2025", "side": "SELL", "price": 140, "quantity": 75},
+]
+
+def test_append_and_partition():
+    """Test fills are appended and partitioned by trading day."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+            history.append_fills(SAMPLE_FILLS)
+
+            assert history.days() == ["2025-03-24", "2025-03-25"], "❌ Day partitions are incorrect."
+            assert len(history.load("2025-03-24")) == 4, "❌ 2025-03-24 partition should hold 4 fills."
+            assert len(history.load("2025-03-25")) == 2, "❌ 2025-03-25 partition should hold 2 fills."
+
+            # Appending again must extend the partition, never overwrite it
+            history.append_fill(SAMPLE_FILLS[0])
+            assert len(history.load("2025-03-24")) == 5, "❌ Append overwrote the existing partition."
+
+            # A fresh instance must read back what was persisted
+            reopened = TradeHistory(base_dir)
+            assert len(reopened.load()) == 7, "❌ Reopened history lost fills."
+        logging.info("✅ Trade history append and partition test passed.")
+    except Exception as e:
+        logging.error(f"❌ Trade history append and partition test failed: {e}")
+
+def test_pnl_by_strategy():
+    """Test realised P&L grouped by strategy."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+            history.append_fills(SAMPLE_FILLS)
+
+            pnl = history.pnl_by("strategy")
+            expected_pnl = {"supertrend": 750.0, "trend_flip": -750.0}
+
+            logging.debug(f"Calculated P&L by strategy: {pnl}")
+            assert pnl == expected_pnl, "❌ P&L by strategy is incorrect."
+        logging.info("✅ P&L by strategy test passed.")
+    except Exception as e:
+        logging.error(f"❌ P&L by strategy test failed: {e}")
+
+def test_pnl_by_symbol_and_expiry():
+    """Test realised P&L grouped by symbol and by expiry, with a date filter."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+            history.append_fills(SAMPLE_FILLS)
+
+            pnl_symbol = history.pnl_by("symbol", start="2025-03-24", end="2025-03-24")
+            expected_symbol = {"NIFTY27MAR2522600CE": 1500.0, "NIFTY27MAR2522500PE": -750.0}
+            assert pnl_symbol == expected_symbol, "❌ P&L by symbol is incorrect."
+
+            pnl_expiry = history.pnl_by("expiry")
+            expected_expiry = {"27-Mar-2025": 750.0, "03-Apr-2025": -750.0}
+            assert pnl_expiry == expected_expiry, "❌ P&L by expiry is incorrect."
+        logging.info("✅ P&L by symbol and expiry test passed.")
+    except Exception as e:
+        logging.error(f"❌ P&L by symbol and expiry test failed: {e}")
+
+def test_pnl_by_time_bucket():
+    """Test realised P&L grouped into hourly time buckets (by exit time)."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+            history.append_fills(SAMPLE_FILLS)
+
+            pnl = history.pnl_by("time_bucket", bucket="1h")
+            expected_pnl = {
+                "2025-03-24T10:00": 1500.0,
+                "2025-03-24T11:00": -750.0,
+                "2025-03-25T13:00": -750.0,
+            }
+            assert pnl == expected_pnl, "❌ P&L by time bucket is incorrect."
+        logging.info("✅ P&L by time bucket test passed.")
+    except Exception as e:
+        logging.error(f"❌ P&L by time bucket test failed: {e}")
+
+def test_win_rate():
+    """Test win rate over closed round trips."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+            history.append_fills(SAMPLE_FILLS)
+
+            win_rate = history.win_rate()
+            assert np.isclose(win_rate, 1 / 3), "❌ Overall win rate is incorrect."
+
+            win_rate_by_strategy = history.win_rate(by="strategy")
+            assert np.isclose(win_rate_by_strategy["supertrend"], 0.5), "❌ Supertrend win rate is incorrect."
+            assert win_rate_by_strategy["trend_flip"] == 0.0, "❌ Trend flip win rate is incorrect."
+        logging.info("✅ Win rate test passed.")
+    except Exception as e:
+        logging.error(f"❌ Win rate test failed: {e}")
+
+def test_query_speed():
+    """Test P&L aggregation over several months of fills stays fast."""
+    try:
+        with tempfile.TemporaryDirectory() as base_dir:
+            history = TradeHistory(base_dir)
+
+            # ~60 trading days x 200 round trips per day
+            fills = []
+            for day in range(60):
+                date = f"2025-{1 + day // 28:02d}-{1 + day % 28:02d}"
+                for i in range(200):
+                    minute = f"{9 + i // 60:02d}:{i % 60:02d}"
+                    strategy = "supertrend" if i % 2 else "trend_flip"
+                    fills.append({"timestamp": f"{date}T{minute}:00", "strategy": strategy,
+                                  "symbol": "NIFTY27MAR2522600CE", "expiry": "27-Mar-2025",
+                                  "side": "BUY", "price": 100, "quantity": 75})
+                    fills.append({"timestamp": f"{date}T{minute}:30", "strategy": strategy,
+                                  "symbol": "NIFTY27MAR2522600CE", "expiry": "27-Mar-2025",
+                                  "side": "SELL", "price": 101, "quantity": 75})
+            history.append_fills(fills)
+
+            start = time.perf_counter()
+            pnl = history.pnl_by("strategy")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            logging.info(f"🔹 Aggregated {len(fills)} fills in {elapsed_ms:.2f} ms")
+            assert pnl == {"supertrend": 450000.0, "trend_flip": 450000.0}, "❌ Bulk P&L is incorrect."
+            assert elapsed_ms < 100, "❌ P&L aggregation is too slow."
+        logging.info("✅ Trade history query speed test passed.")
+    except Exception as e:
+        logging.error(f"❌ Trade history query speed test failed: {e}")
+
+if __name__ == "__main__":
+    logging.info("🔍 Running Trade History Tests...\n")
+    time.sleep(1)
+    test_append_and_partition()
+    time.sleep(1)
+    test_pnl_by_strategy()
+    time.sleep(1)
+    test_pnl_by_symbol_and_expiry()
+    time.sleep(1)
+    test_pnl_by_time_bucket()
+    time.sleep(1)
+    test_win_rate()
+    time.sleep(1)
+    test_query_speed()
+    logging.info("\n✅ All tests completed.")